@@ -0,0 +1,64 @@
+/**
+ * Bounded memoization cache used by the knowledge base and tools.
+ */
+
+/**
+ * Recursively freeze a value so shared constants cannot be mutated.
+ */
+export function deepFreeze<T>(value: T): T {
+    if (value !== null && typeof value === 'object') {
+        for (const child of Object.values(value)) {
+            deepFreeze(child);
+        }
+        Object.freeze(value);
+    }
+    return value;
+}
+
+/**
+ * Least-recently-used cache holding at most `maxSize` entries.
+ */
+export class LruCache<K, V> {
+    private maxSize: number;
+    private entries: Map<K, V> = new Map();
+
+    constructor(maxSize: number) {
+        this.maxSize = maxSize;
+    }
+
+    /**
+     * Get a cached value, marking it as most recently used.
+     */
+    get(key: K): V | undefined {
+        const value = this.entries.get(key);
+        if (value !== undefined) {
+            this.entries.delete(key);
+            this.entries.set(key, value);
+        }
+        return value;
+    }
+
+    /**
+     * Store a value, evicting the least recently used entry when full.
+     */
+    set(key: K, value: V): void {
+        this.entries.delete(key);
+        this.entries.set(key, value);
+        if (this.entries.size > this.maxSize) {
+            // Map iterates in insertion order, so the first key is the oldest
+            this.entries.delete(this.entries.keys().next().value as K);
+        }
+    }
+
+    /**
+     * Get a cached value, computing and storing it on a miss.
+     */
+    getOrCompute(key: K, compute: () => V): V {
+        let value = this.get(key);
+        if (value === undefined) {
+            value = compute();
+            this.set(key, value);
+        }
+        return value;
+    }
+}
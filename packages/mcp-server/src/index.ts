@@ -10,8 +10,10 @@
 export {
     createServer,
     runServer,
+    invalidateKnowledgeBase,
     KnowledgeBase,
     TOOLS,
+    TOOL_HANDLERS,
     getBestPractice,
     listTopics,
     searchBestPractices,
@@ -21,6 +23,10 @@ export {
 } from './server.js';
 
 // Re-export types
+export type {
+    ToolArguments,
+    ToolHandler,
+} from './server.js';
 export type {
     Rule,
     Section,
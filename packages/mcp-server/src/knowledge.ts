@@ -18,6 +18,265 @@ import {
     CODE_EXAMPLE_PATTERNS,
     RULE_PREFIXES,
 } from './types.js';
+import { LruCache } from './cache.js';
+
+// Rule file parsing patterns, compiled once per process
+const SECTION_HEADER_RE = /^## (\d+)\. ([^(]+)\((\w+(?:-\w+)?)\)\s*$/;
+const IMPACT_LEVEL_RE = /^\w+$/;
+const RULE_IMPACT_RE = /^\w+/;
+const SUMMARY_RE = /##[^\n]+\n+([^\n#]+)/;
+const INCORRECT_RE = /\*\*Incorrect[^*]*\*\*[:\s]*([^\n]*)\n+```(\w+)\n([\s\S]*?)```/g;
+const CORRECT_RE = /\*\*Correct[^*]*\*\*[:\s]*([^\n]*)\n+```(\w+)\n([\s\S]*?)```/g;
+const REF_RE = /Reference:\s*\[([^\]]+)\]\(([^)]+)\)/g;
+const WORD_CHAR_RE = /\w/;
+
+// Characters that separate words in a code example pattern name
+const PATTERN_SEPARATOR_RE = /[ _]/g;
+
+// Section prefixes without their trailing dash, longest first so compound
+// prefixes like 'semantic-cache' are tried before any shorter one
+const SECTION_PREFIXES = RULE_PREFIXES
+    .map(prefix => prefix.slice(0, -1))
+    .sort((a, b) => b.length - a.length);
+
+// Distinct queries remembered per lookup method
+const RESULT_CACHE_SIZE = 128;
+
+const FRONTMATTER_DELIMITER = '---';
+const CODE_FENCE = '```';
+const REF_MARKER = 'Reference:';
+const SECTION_IMPACT_LABEL = '**Impact:** ';
+const SECTION_DESCRIPTION_LABEL = '**Description:** ';
+const SECTIONS_FILE = '_sections.md';
+
+/**
+ * Resolve the knowledge directory, defaulting to the bundled one.
+ */
+export function resolveKnowledgeDir(knowledgeDir?: string): string {
+    return knowledgeDir || path.join(__dirname, 'knowledge');
+}
+
+/**
+ * List the rule files and the sections file in a rules directory, by name.
+ */
+function listMarkdownFiles(rulesDir: string): string[] {
+    if (!fs.existsSync(rulesDir)) {
+        return [];
+    }
+    return fs.readdirSync(rulesDir, { withFileTypes: true })
+        .filter(entry => !entry.isDirectory()
+            && entry.name.endsWith('.md')
+            && (!entry.name.startsWith('_') || entry.name === SECTIONS_FILE))
+        .map(entry => entry.name)
+        .sort();
+}
+
+/**
+ * Skip the whitespace run starting at `from` and return the index just past
+ * its last line break, or -1 if the run contains no line break.
+ */
+function skipToNextLine(content: string, from: number): number {
+    let next = -1;
+    for (let i = from; i < content.length && content.charCodeAt(i) <= 32; i++) {
+        if (content.charCodeAt(i) === 10) {
+            next = i + 1;
+        }
+    }
+    return next;
+}
+
+/**
+ * Split a rule file into its frontmatter fields and markdown body.
+ *
+ * Frontmatter is a line-oriented `key: value` block between `---` delimiters,
+ * so a single line scan replaces a regex pass per field.
+ */
+function parseFrontmatter(content: string): { fields: Map<string, string>; body: string } | null {
+    if (!content.startsWith(FRONTMATTER_DELIMITER)) {
+        return null;
+    }
+    const start = skipToNextLine(content, FRONTMATTER_DELIMITER.length);
+    if (start < 0) {
+        return null;
+    }
+
+    // Find the closing delimiter: a `---` line followed by a line break
+    let end = content.indexOf('\n' + FRONTMATTER_DELIMITER, start);
+    let bodyStart = -1;
+    while (end >= 0) {
+        bodyStart = skipToNextLine(content, end + 1 + FRONTMATTER_DELIMITER.length);
+        if (bodyStart >= 0) {
+            break;
+        }
+        end = content.indexOf('\n' + FRONTMATTER_DELIMITER, end + 1);
+    }
+    if (end < 0) {
+        return null;
+    }
+
+    const fields = new Map<string, string>();
+    for (const line of content.slice(start, end).split('\n')) {
+        const colon = line.indexOf(':');
+        if (colon < 0) {
+            continue;
+        }
+        const key = line.slice(0, colon).trim();
+        if (!fields.has(key)) {
+            fields.set(key, line.slice(colon + 1).trim());
+        }
+    }
+
+    return { fields, body: content.slice(bodyStart) };
+}
+
+/**
+ * Return the index of the first non-blank line at or after `from`.
+ */
+function nextNonBlankLine(lines: string[], from: number): number {
+    let i = from;
+    while (i < lines.length && lines[i].trim() === '') {
+        i++;
+    }
+    return i;
+}
+
+/**
+ * Return the trimmed value of a `**Label:** value` line, or null if the line
+ * is missing or has a different label.
+ */
+function labeledValue(line: string | undefined, label: string): string | null {
+    return line !== undefined && line.startsWith(label) ? line.slice(label.length).trim() : null;
+}
+
+/**
+ * Return the body of the first code block opened by `opening` (for example
+ * "```python\n"), or null if there is none.
+ */
+function findCodeBlock(content: string, opening: string): string | null {
+    const start = content.indexOf(opening);
+    if (start < 0) {
+        return null;
+    }
+    const bodyStart = start + opening.length;
+    const end = content.indexOf(CODE_FENCE, bodyStart);
+    return end < 0 ? null : content.slice(bodyStart, end);
+}
+
+/**
+ * Return the body of the first code block with any (or no) language tag.
+ */
+function findAnyCodeBlock(content: string): string | null {
+    let start = content.indexOf(CODE_FENCE);
+    while (start >= 0) {
+        // An opening fence is ``` followed by an optional language tag and a newline
+        let lineEnd = start + CODE_FENCE.length;
+        while (lineEnd < content.length && WORD_CHAR_RE.test(content[lineEnd])) {
+            lineEnd++;
+        }
+        if (content[lineEnd] === '\n') {
+            const end = content.indexOf(CODE_FENCE, lineEnd + 1);
+            return end < 0 ? null : content.slice(lineEnd + 1, end);
+        }
+        start = content.indexOf(CODE_FENCE, start + 1);
+    }
+    return null;
+}
+
+/**
+ * Pair each **Incorrect** code block in a rule with the matching **Correct** one.
+ */
+function extractAntiPatterns(rule: Rule, category: string): AntiPattern[] {
+    const incorrectMatches = Array.from(rule.content.matchAll(INCORRECT_RE));
+    const correctMatches = Array.from(rule.content.matchAll(CORRECT_RE));
+
+    const antiPatterns: AntiPattern[] = [];
+    for (let i = 0; i < Math.min(incorrectMatches.length, correctMatches.length); i++) {
+        const inc = incorrectMatches[i];
+        const cor = correctMatches[i];
+        antiPatterns.push({
+            title: inc[1].trim() || rule.title,
+            reason: rule.impactDescription,
+            badCode: inc[3].trim(),
+            goodCode: cor[3].trim(),
+            language: inc[2],
+            category,
+        });
+    }
+    return antiPatterns;
+}
+
+/**
+ * Return the shared instance of a string that repeats across rules, so
+ * each rule doesn't hold its own copy of the same tag or impact level.
+ */
+function intern(pool: Map<string, string>, value: string): string {
+    const existing = pool.get(value);
+    if (existing !== undefined) {
+        return existing;
+    }
+    pool.set(value, value);
+    return value;
+}
+
+/**
+ * Copy anti-patterns grouped by category, so callers can't change cached results.
+ */
+function copyAntiPatterns(grouped: Record<string, AntiPattern[]>): Record<string, AntiPattern[]> {
+    const copy: Record<string, AntiPattern[]> = {};
+    for (const [category, patterns] of Object.entries(grouped)) {
+        copy[category] = patterns.map(pattern => ({ ...pattern }));
+    }
+    return copy;
+}
+
+/**
+ * Copy a code example, so callers can't change cached results.
+ */
+function copyCodeExample(example: CodeExample): CodeExample {
+    return {
+        ...example,
+        notes: example.notes.slice(),
+        references: example.references.map(ref => ({ ...ref })),
+    };
+}
+
+/**
+ * A rule with its search relevance score.
+ */
+interface ScoredRule {
+    score: number;
+    rule: Rule;
+}
+
+/**
+ * Insert into a list kept in descending score order, after any equal scores
+ * (matching a stable sort), then drop whatever falls past `limit`.
+ */
+function insertTopRanked(ranked: ScoredRule[], item: ScoredRule, limit: number): void {
+    if (ranked.length >= limit && ranked[ranked.length - 1].score >= item.score) {
+        return;
+    }
+    let i = ranked.length;
+    while (i > 0 && ranked[i - 1].score < item.score) {
+        i--;
+    }
+    ranked.splice(i, 0, item);
+    if (ranked.length > limit) {
+        ranked.pop();
+    }
+}
+
+/**
+ * Lowercased rule fields used by searchRules, computed once at load time.
+ */
+interface SearchEntry {
+    rule: Rule;
+    titleLower: string;
+    titleWords: Set<string>;
+    tagsLower: string[];
+    impactDescriptionLower: string;
+    contentLower: string;
+}
 
 /**
  * Knowledge base for Redis best practices.
@@ -27,74 +286,119 @@ export class KnowledgeBase {
     private knowledgeDir: string;
     private rulesDir: string;
     private sections: Map<string, Section> = new Map();
+    private sortedSections: Section[] = [];
+    private sortedTopics: string[] = [];
+    // sortedTopics as a markdown bullet list
+    private topicList = '';
     private rules: Map<string, Rule> = new Map();
     private rulesByTag: Map<string, Rule[]> = new Map();
-    private fullGuide: string = '';
-
-    constructor(knowledgeDir?: string) {
-        if (knowledgeDir) {
-            this.knowledgeDir = knowledgeDir;
-        } else {
-            // Default to bundled knowledge directory
-            this.knowledgeDir = path.join(__dirname, 'knowledge');
-        }
+    // Topic without its category prefix -> rule, first matching prefix wins
+    private topicAliases: Map<string, Rule> = new Map();
+    // Lowercased search fields per rule, in load order
+    private searchEntries: SearchEntry[] = [];
+    // Anti-patterns extracted at load time, keyed by rule prefix (rules without any are omitted)
+    private ruleAntiPatterns: Map<string, AntiPattern[]> = new Map();
+    private fullGuide: string | null = null;
+    // Rendered markdown per rule, filled on first request
+    private ruleMarkdown: WeakMap<Rule, string> = new WeakMap();
+    // Cached results are copied before they are returned to callers
+    private antiPatternCache = new LruCache<string, Record<string, AntiPattern[]>>(RESULT_CACHE_SIZE);
+    private codeExampleCache = new LruCache<string, CodeExample | null>(RESULT_CACHE_SIZE);
+    private searchCache = new LruCache<string, Rule[]>(RESULT_CACHE_SIZE);
+
+    /**
+     * @param knowledgeDir - Knowledge directory; defaults to the bundled one.
+     * @param ruleFiles - Markdown contents of the rules directory keyed by file
+     *   name, as read by {@link KnowledgeBase.load}. Read synchronously if omitted.
+     */
+    constructor(knowledgeDir?: string, ruleFiles?: Map<string, string>) {
+        this.knowledgeDir = resolveKnowledgeDir(knowledgeDir);
         this.rulesDir = path.join(this.knowledgeDir, 'rules');
-        this.loadKnowledgeBase();
+        this.loadKnowledgeBase(ruleFiles || this.readRuleFiles());
+    }
+
+    /**
+     * Create a knowledge base, reading all rule files concurrently.
+     */
+    static async load(knowledgeDir?: string): Promise<KnowledgeBase> {
+        const rulesDir = path.join(resolveKnowledgeDir(knowledgeDir), 'rules');
+        const files = listMarkdownFiles(rulesDir);
+        const contents = await Promise.all(
+            files.map(file => fs.promises.readFile(path.join(rulesDir, file), 'utf-8'))
+        );
+        const ruleFiles = new Map<string, string>(files.map((file, i) => [file, contents[i]]));
+        return new KnowledgeBase(knowledgeDir, ruleFiles);
+    }
+
+    private readRuleFiles(): Map<string, string> {
+        const ruleFiles = new Map<string, string>();
+        for (const file of listMarkdownFiles(this.rulesDir)) {
+            ruleFiles.set(file, fs.readFileSync(path.join(this.rulesDir, file), 'utf-8'));
+        }
+        return ruleFiles;
     }
 
-    private loadKnowledgeBase(): void {
-        this.loadSections();
-        this.loadRules();
-        this.loadFullGuide();
+    private loadKnowledgeBase(ruleFiles: Map<string, string>): void {
+        // Shared instances of impact levels, tags and section prefixes, only
+        // needed while loading
+        const internedStrings = new Map<string, string>();
+        this.loadSections(ruleFiles, internedStrings);
+        this.loadRules(ruleFiles, internedStrings);
+        this.buildTopicAliases();
+        this.sortedSections = Array.from(this.sections.values())
+            .sort((a, b) => a.number - b.number);
+        this.sortedTopics = Array.from(this.rules.keys()).sort();
+        this.topicList = this.sortedTopics.map(t => `  - ${t}`).join('\n');
     }
 
-    private loadSections(): void {
-        const sectionsFile = path.join(this.rulesDir, '_sections.md');
-        if (!fs.existsSync(sectionsFile)) {
+    private loadSections(ruleFiles: Map<string, string>, internedStrings: Map<string, string>): void {
+        const content = ruleFiles.get(SECTIONS_FILE);
+        if (content === undefined) {
             return;
         }
 
-        const content = fs.readFileSync(sectionsFile, 'utf-8');
+        // Parse sections: a `## N. Name (prefix)` header followed by its
+        // **Impact:** and **Description:** lines
+        const lines = content.split('\n');
+        for (let i = 0; i < lines.length; i++) {
+            const header = SECTION_HEADER_RE.exec(lines[i]);
+            if (!header) {
+                continue;
+            }
 
-        // Parse sections
-        const sectionPattern = /## (\d+)\. ([^(]+)\((\w+(?:-\w+)?)\)\s*\n\*\*Impact:\*\* (\w+)\s*\n\*\*Description:\*\* (.+)/g;
+            const impactLine = nextNonBlankLine(lines, i + 1);
+            const impact = labeledValue(lines[impactLine], SECTION_IMPACT_LABEL);
+            if (!impact || !IMPACT_LEVEL_RE.test(impact)) {
+                continue;
+            }
 
-        let match;
-        while ((match = sectionPattern.exec(content)) !== null) {
-            const number = parseInt(match[1], 10);
-            const name = match[2].trim();
-            const prefix = match[3].trim();
-            const impact = match[4].trim();
-            const description = match[5].trim();
+            const descriptionLine = nextNonBlankLine(lines, impactLine + 1);
+            const description = labeledValue(lines[descriptionLine], SECTION_DESCRIPTION_LABEL);
+            if (!description) {
+                continue;
+            }
 
+            const prefix = intern(internedStrings, header[3]);
             this.sections.set(prefix, {
-                number,
-                name,
+                number: parseInt(header[1], 10),
+                name: header[2].trim(),
                 prefix,
-                impact,
+                impact: intern(internedStrings, impact),
                 description,
                 rules: [],
             });
+            i = descriptionLine;
         }
     }
 
-    private loadRules(): void {
-        if (!fs.existsSync(this.rulesDir)) {
-            return;
-        }
-
-        const files = fs.readdirSync(this.rulesDir);
-        for (const file of files) {
+    private loadRules(ruleFiles: Map<string, string>, internedStrings: Map<string, string>): void {
+        for (const [file, content] of ruleFiles) {
             // Skip special files
             if (file.startsWith('_')) {
                 continue;
             }
-            if (!file.endsWith('.md')) {
-                continue;
-            }
 
-            const filePath = path.join(this.rulesDir, file);
-            const rule = this.parseRuleFile(filePath);
+            const rule = this.parseRuleFile(file, content, internedStrings);
             if (rule) {
                 this.rules.set(rule.prefix, rule);
 
@@ -106,6 +410,8 @@ export class KnowledgeBase {
                     this.rulesByTag.get(tag)!.push(rule);
                 }
 
+                this.indexRuleForSearch(rule);
+
                 // Add to section
                 const sectionPrefix = this.getSectionPrefix(rule.prefix);
                 const section = this.sections.get(sectionPrefix);
@@ -113,52 +419,89 @@ export class KnowledgeBase {
                     section.rules.push(rule);
                     rule.sectionNumber = section.number;
                 }
+
+                const antiPatterns = extractAntiPatterns(rule, section?.name || 'Other');
+                if (antiPatterns.length > 0) {
+                    this.ruleAntiPatterns.set(rule.prefix, antiPatterns);
+                }
+            }
+        }
+
+        // Keep section rules in title order for listings and the full guide
+        for (const section of this.sections.values()) {
+            section.rules.sort((a, b) => a.title.localeCompare(b.title));
+        }
+    }
+
+    /**
+     * Index rules by their topic with the category prefix stripped, so that
+     * short topics like "pipelining" resolve with a single lookup.
+     */
+    private buildTopicAliases(): void {
+        for (const prefix of RULE_PREFIXES) {
+            for (const [key, rule] of this.rules) {
+                if (key.startsWith(prefix)) {
+                    const alias = key.slice(prefix.length);
+                    if (!this.topicAliases.has(alias)) {
+                        this.topicAliases.set(alias, rule);
+                    }
+                }
             }
         }
     }
 
+    /**
+     * Precompute the lowercased fields searchRules matches against.
+     */
+    private indexRuleForSearch(rule: Rule): void {
+        const titleLower = rule.title.toLowerCase();
+        this.searchEntries.push({
+            rule,
+            titleLower,
+            titleWords: new Set(titleLower.split(/\s+/)),
+            tagsLower: rule.tags.map(tag => tag.toLowerCase()),
+            impactDescriptionLower: rule.impactDescription.toLowerCase(),
+            contentLower: rule.content.toLowerCase(),
+        });
+    }
+
     private getSectionPrefix(rulePrefix: string): string {
         // Handle compound prefixes like 'semantic-cache-best-practices'
-        for (const prefix of ['semantic-cache', 'data', 'conn', 'ram', 'json', 'rqe', 'vector', 'stream', 'cluster', 'security', 'observe']) {
-            if (rulePrefix.startsWith(prefix + '-') || rulePrefix === prefix) {
+        for (const prefix of SECTION_PREFIXES) {
+            if (rulePrefix.startsWith(prefix)
+                && (rulePrefix.length === prefix.length || rulePrefix[prefix.length] === '-')) {
                 return prefix;
             }
         }
         return rulePrefix.split('-')[0];
     }
 
-    private parseRuleFile(filePath: string): Rule | null {
-        const content = fs.readFileSync(filePath, 'utf-8');
-
+    private parseRuleFile(file: string, content: string, internedStrings: Map<string, string>): Rule | null {
         // Parse frontmatter
-        const frontmatterMatch = content.match(/^---\s*\n([\s\S]*?)\n---\s*\n([\s\S]*)$/);
-        if (!frontmatterMatch) {
+        const frontmatter = parseFrontmatter(content);
+        if (!frontmatter) {
             return null;
         }
 
-        const frontmatter = frontmatterMatch[1];
-        const body = frontmatterMatch[2];
-
-        // Extract frontmatter fields
-        const titleMatch = frontmatter.match(/title:\s*(.+)/);
-        const impactMatch = frontmatter.match(/impact:\s*(\w+)/);
-        const impactDescMatch = frontmatter.match(/impactDescription:\s*(.+)/);
-        const tagsMatch = frontmatter.match(/tags:\s*(.+)/);
+        const { fields, body } = frontmatter;
+        const title = fields.get('title');
+        // The impact level is the leading word, e.g. HIGH in `impact: HIGH (critical)`
+        const impactMatch = RULE_IMPACT_RE.exec(fields.get('impact') || '');
 
-        if (!titleMatch || !impactMatch) {
+        if (!title || !impactMatch) {
             return null;
         }
 
-        const title = titleMatch[1].trim();
-        const impact = impactMatch[1].trim();
-        const impactDescription = impactDescMatch ? impactDescMatch[1].trim() : '';
-        const tags = tagsMatch ? tagsMatch[1].split(',').map(t => t.trim()) : [];
+        const impact = intern(internedStrings, impactMatch[0]);
+        const impactDescription = fields.get('impactDescription') || '';
+        const tagList = fields.get('tags');
+        const tags = tagList ? tagList.split(',').map(t => intern(internedStrings, t.trim())) : [];
 
         // Extract prefix from filename
-        const prefix = path.basename(filePath, '.md');
+        const prefix = path.basename(file, '.md');
 
         // Extract summary (first paragraph of body after first heading)
-        const summaryMatch = body.match(/##[^\n]+\n+([^\n#]+)/);
+        const summaryMatch = body.match(SUMMARY_RE);
         const summary = summaryMatch ? summaryMatch[1].trim() : '';
 
         return {
@@ -173,13 +516,12 @@ export class KnowledgeBase {
         };
     }
 
-    private loadFullGuide(): void {
+    private loadFullGuide(): string {
         const agentsFile = path.join(this.knowledgeDir, 'AGENTS.md');
         if (fs.existsSync(agentsFile)) {
-            this.fullGuide = fs.readFileSync(agentsFile, 'utf-8');
-        } else {
-            this.fullGuide = this.generateFullGuide();
+            return fs.readFileSync(agentsFile, 'utf-8');
         }
+        return this.generateFullGuide();
     }
 
     private generateFullGuide(): string {
@@ -206,57 +548,58 @@ export class KnowledgeBase {
             '',
         ];
 
-        // Add TOC
-        const sortedSections = Array.from(this.sections.values())
-            .sort((a, b) => a.number - b.number);
-
-        for (const section of sortedSections) {
+        // Build the TOC and the section bodies in one pass over the sections
+        // (section rules are already in title order from loadRules)
+        const body: string[] = [];
+        for (const section of this.sortedSections) {
             const anchor = `${section.number}-${section.name.toLowerCase().replace(/ /g, '-')}`;
             lines.push(`${section.number}. [${section.name}](#${anchor}) — **${section.impact}**`);
-            for (const rule of section.rules.sort((a, b) => a.title.localeCompare(b.title))) {
+            body.push(
+                `## ${section.number}. ${section.name}`,
+                '',
+                `**Impact:** ${section.impact}`,
+                '',
+                `*${section.description}*`,
+                '',
+            );
+
+            for (const rule of section.rules) {
                 const ruleAnchor = rule.title.toLowerCase().replace(/ /g, '-');
                 lines.push(`   - [${rule.title}](#${ruleAnchor})`);
+                body.push(
+                    `### ${rule.title}`,
+                    '',
+                    `**Impact: ${rule.impact}** (${rule.impactDescription})`,
+                    '',
+                    rule.content,
+                    '',
+                    '---',
+                    '',
+                );
             }
         }
 
-        lines.push('');
-        lines.push('---');
-        lines.push('');
-
-        // Add sections
-        for (const section of sortedSections) {
-            lines.push(`## ${section.number}. ${section.name}`);
-            lines.push('');
-            lines.push(`**Impact:** ${section.impact}`);
-            lines.push('');
-            lines.push(`*${section.description}*`);
-            lines.push('');
-
-            for (const rule of section.rules.sort((a, b) => a.title.localeCompare(b.title))) {
-                lines.push(`### ${rule.title}`);
-                lines.push('');
-                lines.push(`**Impact: ${rule.impact}** (${rule.impactDescription})`);
-                lines.push('');
-                lines.push(rule.content);
-                lines.push('');
-                lines.push('---');
-                lines.push('');
-            }
-        }
+        lines.push('', '---', '');
 
-        return lines.join('\n');
+        return lines.concat(body).join('\n');
     }
 
     /**
      * Convert a rule to markdown format.
+     * The result is cached, so rules must not be mutated after loading.
      */
     ruleToMarkdown(rule: Rule): string {
-        const lines: string[] = [`# ${rule.title}\n`];
-        lines.push(`**Impact:** ${rule.impact} (${rule.impactDescription})\n`);
-        lines.push(`**Tags:** ${rule.tags.join(', ')}\n`);
-        lines.push('---\n');
-        lines.push(rule.content);
-        return lines.join('\n');
+        let markdown = this.ruleMarkdown.get(rule);
+        if (markdown === undefined) {
+            const lines: string[] = [`# ${rule.title}\n`];
+            lines.push(`**Impact:** ${rule.impact} (${rule.impactDescription})\n`);
+            lines.push(`**Tags:** ${rule.tags.join(', ')}\n`);
+            lines.push('---\n');
+            lines.push(rule.content);
+            markdown = lines.join('\n');
+            this.ruleMarkdown.set(rule, markdown);
+        }
+        return markdown;
     }
 
     /**
@@ -269,68 +612,87 @@ export class KnowledgeBase {
         }
 
         // Try with common prefixes
-        for (const prefix of RULE_PREFIXES) {
-            const fullKey = `${prefix}${topic}`;
-            if (this.rules.has(fullKey)) {
-                return this.rules.get(fullKey)!;
-            }
+        return this.topicAliases.get(topic) ?? null;
+    }
+
+    /**
+     * Search rules by query string, best matches first.
+     * If `limit` is given, only that many top matches are returned.
+     */
+    searchRules(query: string, limit?: number): Rule[] {
+        if (limit !== undefined && limit <= 0) {
+            return [];
         }
 
-        return null;
+        // Scoring only depends on the lowercased query
+        const queryLower = query.toLowerCase();
+        const key = JSON.stringify([queryLower, limit ?? null]);
+        return this.searchCache.getOrCompute(key, () => this.rankRules(queryLower, limit)).slice();
     }
 
     /**
-     * Search rules by query string.
+     * Score every rule against the query with a linear scan over the
+     * precomputed lowercase fields.
+     *
+     * There is deliberately no token index: scoring matches the query as a
+     * substring of titles, tags and content, which exact-token postings cannot
+     * answer, and a substring scan of the token vocabulary was slower than
+     * scanning the rules themselves.
      */
-    searchRules(query: string): Rule[] {
-        const queryLower = query.toLowerCase();
+    private rankRules(queryLower: string, limit?: number): Rule[] {
         const queryWords = new Set(queryLower.split(/\s+/));
 
-        const scoredRules: Array<{ score: number; rule: Rule }> = [];
+        const scoredRules: ScoredRule[] = [];
 
-        for (const rule of this.rules.values()) {
+        for (const entry of this.searchEntries) {
             let score = 0;
 
             // Title match (highest weight)
-            if (rule.title.toLowerCase().includes(queryLower)) {
+            if (entry.titleLower.includes(queryLower)) {
                 score += 10;
             }
 
             // Exact title word match
-            const titleWords = new Set(rule.title.toLowerCase().split(/\s+/));
             for (const word of queryWords) {
-                if (titleWords.has(word)) {
+                if (entry.titleWords.has(word)) {
                     score += 5;
                 }
             }
 
             // Tag match
-            for (const tag of rule.tags) {
-                if (tag.toLowerCase().includes(queryLower)) {
+            for (const tag of entry.tagsLower) {
+                if (tag.includes(queryLower)) {
                     score += 3;
                 }
-                if (queryWords.has(tag.toLowerCase())) {
+                if (queryWords.has(tag)) {
                     score += 2;
                 }
             }
 
             // Content match
-            if (rule.content.toLowerCase().includes(queryLower)) {
+            if (entry.contentLower.includes(queryLower)) {
                 score += 1;
             }
 
             // Impact description match
-            if (rule.impactDescription.toLowerCase().includes(queryLower)) {
+            if (entry.impactDescriptionLower.includes(queryLower)) {
                 score += 2;
             }
 
             if (score > 0) {
-                scoredRules.push({ score, rule });
+                if (limit === undefined) {
+                    scoredRules.push({ score, rule: entry.rule });
+                } else {
+                    // Only the best `limit` matches are kept, already in order
+                    insertTopRanked(scoredRules, { score, rule: entry.rule }, limit);
+                }
             }
         }
 
         // Sort by score descending
-        scoredRules.sort((a, b) => b.score - a.score);
+        if (limit === undefined) {
+            scoredRules.sort((a, b) => b.score - a.score);
+        }
 
         return scoredRules.map(sr => sr.rule);
     }
@@ -339,28 +701,38 @@ export class KnowledgeBase {
      * List all available topics.
      */
     listAllTopics(): string[] {
-        return Array.from(this.rules.keys()).sort();
+        return this.sortedTopics.slice();
+    }
+
+    /**
+     * Get all available topics as a markdown bullet list.
+     */
+    topicsToMarkdown(): string {
+        return this.topicList;
     }
 
     /**
      * Get all sections, optionally filtered by category.
      */
     getSections(category?: string): Section[] {
-        let sections = Array.from(this.sections.values())
-            .sort((a, b) => a.number - b.number);
-
         if (category) {
-            const prefix = CATEGORY_MAP[category] || category;
-            sections = sections.filter(s => s.prefix === prefix);
+            const section = this.sections.get(CATEGORY_MAP[category] || category);
+            return section ? [section] : [];
         }
 
-        return sections;
+        return this.sortedSections.slice();
     }
 
     /**
      * Get anti-patterns, optionally filtered by topic.
      */
     getAntiPatterns(topic?: string): Record<string, AntiPattern[]> {
+        return copyAntiPatterns(
+            this.antiPatternCache.getOrCompute(topic || '', () => this.collectAntiPatterns(topic))
+        );
+    }
+
+    private collectAntiPatterns(topic?: string): Record<string, AntiPattern[]> {
         const antiPatterns: Record<string, AntiPattern[]> = {};
 
         for (const rule of this.rules.values()) {
@@ -373,42 +745,13 @@ export class KnowledgeBase {
                 }
             }
 
-            // Find incorrect patterns in content
-            const incorrectPattern = /\*\*Incorrect[^*]*\*\*[:\s]*([^\n]*)\n+```(\w+)\n([\s\S]*?)```/g;
-            const correctPattern = /\*\*Correct[^*]*\*\*[:\s]*([^\n]*)\n+```(\w+)\n([\s\S]*?)```/g;
-
-            const incorrectMatches: RegExpExecArray[] = [];
-            const correctMatches: RegExpExecArray[] = [];
-
-            let match;
-            while ((match = incorrectPattern.exec(rule.content)) !== null) {
-                incorrectMatches.push(match);
-            }
-            while ((match = correctPattern.exec(rule.content)) !== null) {
-                correctMatches.push(match);
-            }
-
-            if (incorrectMatches.length > 0 && correctMatches.length > 0) {
-                const sectionPrefix = this.getSectionPrefix(rule.prefix);
-                const section = this.sections.get(sectionPrefix);
-                const category = section?.name || 'Other';
-
+            const patterns = this.ruleAntiPatterns.get(rule.prefix);
+            if (patterns) {
+                const category = patterns[0].category;
                 if (!antiPatterns[category]) {
                     antiPatterns[category] = [];
                 }
-
-                for (let i = 0; i < Math.min(incorrectMatches.length, correctMatches.length); i++) {
-                    const inc = incorrectMatches[i];
-                    const cor = correctMatches[i];
-                    antiPatterns[category].push({
-                        title: inc[1].trim() || rule.title,
-                        reason: rule.impactDescription,
-                        badCode: inc[3].trim(),
-                        goodCode: cor[3].trim(),
-                        language: inc[2],
-                        category,
-                    });
-                }
+                antiPatterns[category].push(...patterns);
             }
         }
 
@@ -419,8 +762,16 @@ export class KnowledgeBase {
      * Get a code example for a specific pattern.
      */
     getCodeExample(pattern: string, language: string = 'python'): CodeExample | null {
+        const example = this.codeExampleCache.getOrCompute(
+            JSON.stringify([pattern, language]),
+            () => this.findCodeExample(pattern, language),
+        );
+        return example && copyCodeExample(example);
+    }
+
+    private findCodeExample(pattern: string, language: string): CodeExample | null {
         // Normalize pattern
-        const patternNormalized = pattern.toLowerCase().replace(/_/g, '-').replace(/ /g, '-');
+        const patternNormalized = pattern.toLowerCase().replace(PATTERN_SEPARATOR_RE, '-');
         const rulePrefix = PATTERN_MAP[patternNormalized] || patternNormalized;
 
         const rule = this.getRuleByTopic(rulePrefix);
@@ -428,35 +779,28 @@ export class KnowledgeBase {
             return null;
         }
 
-        // Extract code example from rule
-        const codePattern = new RegExp(`\`\`\`${language}\\n([\\s\\S]*?)\`\`\``, 'g');
-        let match = codePattern.exec(rule.content);
-
-        if (!match) {
-            // Try any code block
-            const anyCodePattern = /```\w*\n([\s\S]*?)```/;
-            match = anyCodePattern.exec(rule.content);
-        }
-
-        if (!match) {
+        // Extract code example from rule, falling back to any code block
+        const code = findCodeBlock(rule.content, `${CODE_FENCE}${language}\n`) ?? findAnyCodeBlock(rule.content);
+        if (code === null) {
             return null;
         }
 
-        // Extract references
+        // Extract references, scanning only from the first reference marker
         const refs: Reference[] = [];
-        const refPattern = /Reference:\s*\[([^\]]+)\]\(([^)]+)\)/g;
-        let refMatch;
-        while ((refMatch = refPattern.exec(rule.content)) !== null) {
-            refs.push({
-                title: refMatch[1],
-                url: refMatch[2],
-            });
+        const refsStart = rule.content.indexOf(REF_MARKER);
+        if (refsStart >= 0) {
+            for (const refMatch of rule.content.slice(refsStart).matchAll(REF_RE)) {
+                refs.push({
+                    title: refMatch[1],
+                    url: refMatch[2],
+                });
+            }
         }
 
         return {
             title: rule.title,
             description: rule.summary || rule.impactDescription,
-            code: match[1].trim(),
+            code: code.trim(),
             language,
             notes: [],
             references: refs,
@@ -474,6 +818,10 @@ export class KnowledgeBase {
      * Get the complete best practices guide.
      */
     getFullGuide(): string {
+        // Loaded on first use; most sessions never ask for the full guide
+        if (this.fullGuide === null) {
+            this.fullGuide = this.loadFullGuide();
+        }
         return this.fullGuide;
     }
 }
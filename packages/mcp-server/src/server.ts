@@ -5,6 +5,7 @@
  * Redis best practices as callable tools for AI assistants.
  */
 
+import * as path from 'path';
 import { Server } from '@modelcontextprotocol/sdk/server/index.js';
 import { StdioServerTransport } from '@modelcontextprotocol/sdk/server/stdio.js';
 import {
@@ -12,19 +13,60 @@ import {
     ListToolsRequestSchema,
 } from '@modelcontextprotocol/sdk/types.js';
 
-import { KnowledgeBase } from './knowledge.js';
-import {
-    TOOLS,
-    getBestPractice,
-    listTopics,
-    searchBestPractices,
-    getAntiPatterns,
-    getCodeExample,
-    getFullGuide,
-} from './tools.js';
+import { KnowledgeBase, resolveKnowledgeDir } from './knowledge.js';
+import { TOOLS, TOOL_HANDLERS } from './tools.js';
+
+/**
+ * Response to tools/list, built once since the tool definitions never change.
+ */
+const LIST_TOOLS_RESULT = { tools: TOOLS };
+
+// Knowledge bases shared by every server in the process, keyed by absolute directory
+const knowledgeBases = new Map<string, Promise<KnowledgeBase>>();
+
+/**
+ * Get the knowledge base for a directory, loading it on first use.
+ * Loading waits until the first tool call so the handshake and tool
+ * listing never wait on disk I/O.
+ */
+function getKnowledgeBase(knowledgeDir?: string): Promise<KnowledgeBase> {
+    const dir = path.resolve(resolveKnowledgeDir(knowledgeDir));
+    let knowledgeBase = knowledgeBases.get(dir);
+    if (!knowledgeBase) {
+        const loading = KnowledgeBase.load(dir);
+        knowledgeBases.set(dir, loading);
+        // Retry on the next call if loading failed
+        loading.catch(() => {
+            if (knowledgeBases.get(dir) === loading) {
+                knowledgeBases.delete(dir);
+            }
+        });
+        knowledgeBase = loading;
+    }
+    return knowledgeBase;
+}
+
+/**
+ * Drop the cached knowledge base for a directory, defaulting to the bundled
+ * one, so the next tool call from any server reloads it from disk.
+ * Call this after editing rule files in a running process.
+ */
+export function invalidateKnowledgeBase(knowledgeDir?: string): void {
+    knowledgeBases.delete(path.resolve(resolveKnowledgeDir(knowledgeDir)));
+}
+
+/**
+ * Wrap tool output as MCP text content.
+ */
+function textContent(text: string) {
+    return [{ type: 'text' as const, text }];
+}
 
 /**
  * Create and configure the MCP server.
+ *
+ * Servers using the same knowledge directory share one knowledge base, which
+ * is kept until {@link invalidateKnowledgeBase} is called for that directory.
  */
 export function createServer(knowledgeDir?: string): Server {
     const server = new Server(
@@ -39,17 +81,10 @@ export function createServer(knowledgeDir?: string): Server {
         }
     );
 
-    // Initialize knowledge base
-    const knowledgeBase = new KnowledgeBase(knowledgeDir);
-
     /**
      * List all available tools.
      */
-    server.setRequestHandler(ListToolsRequestSchema, async () => {
-        return {
-            tools: TOOLS,
-        };
-    });
+    server.setRequestHandler(ListToolsRequestSchema, async () => LIST_TOOLS_RESULT);
 
     /**
      * Handle tool execution requests.
@@ -57,62 +92,23 @@ export function createServer(knowledgeDir?: string): Server {
     server.setRequestHandler(CallToolRequestSchema, async (request) => {
         const { name, arguments: args } = request.params;
 
-        try {
-            let result: string;
-
-            switch (name) {
-                case 'get_best_practice': {
-                    const topic = (args?.topic as string) || '';
-                    result = getBestPractice(knowledgeBase, topic);
-                    break;
-                }
-                case 'list_topics': {
-                    const category = args?.category as string | undefined;
-                    result = listTopics(knowledgeBase, category);
-                    break;
-                }
-                case 'search_best_practices': {
-                    const query = (args?.query as string) || '';
-                    result = searchBestPractices(knowledgeBase, query);
-                    break;
-                }
-                case 'get_anti_patterns': {
-                    const topic = args?.topic as string | undefined;
-                    result = getAntiPatterns(knowledgeBase, topic);
-                    break;
-                }
-                case 'get_code_example': {
-                    const pattern = (args?.pattern as string) || '';
-                    const language = (args?.language as string) || 'python';
-                    result = getCodeExample(knowledgeBase, pattern, language);
-                    break;
-                }
-                case 'get_full_guide': {
-                    result = getFullGuide(knowledgeBase);
-                    break;
-                }
-                default:
-                    result = `Unknown tool: ${name}`;
-            }
+        const handler = TOOL_HANDLERS.get(name);
+        if (!handler) {
+            return {
+                content: textContent(`Unknown tool: ${name}`),
+            };
+        }
 
+        try {
+            const knowledgeBase = await getKnowledgeBase(knowledgeDir);
             return {
-                content: [
-                    {
-                        type: 'text',
-                        text: result,
-                    },
-                ],
+                content: textContent(handler(knowledgeBase, args)),
             };
         } catch (error) {
             const errorMessage = error instanceof Error ? error.message : String(error);
             console.error(`Error executing tool ${name}:`, error);
             return {
-                content: [
-                    {
-                        type: 'text',
-                        text: `Error: ${errorMessage}`,
-                    },
-                ],
+                content: textContent(`Error: ${errorMessage}`),
                 isError: true,
             };
         }
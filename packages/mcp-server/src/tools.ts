@@ -4,12 +4,27 @@
  * This module defines all available MCP tools and their implementations.
  */
 
-import { KnowledgeBase } from './knowledge.js';
+import type { KnowledgeBase } from './knowledge.js';
+import { deepFreeze } from './cache.js';
+
+// Characters that separate words in a topic name
+const TOPIC_SEPARATOR_RE = /[ _]/g;
+
+// Badge shown next to each section's impact level; anything else is low impact
+const IMPACT_BADGES = new Map<string, string>([
+    ['HIGH', '🔴'],
+    ['MEDIUM', '🟡'],
+]);
+const DEFAULT_IMPACT_BADGE = '🟢';
+
+// Shorter topics match nearly every rule in a fuzzy search
+const MIN_TOPIC_LENGTH = 2;
 
 /**
  * Tool definitions following MCP specification.
+ * Frozen because the same objects are returned on every tools/list request.
  */
-export const TOOLS = [
+export const TOOLS = deepFreeze([
     {
         name: 'get_best_practice',
         description: `**CALL THIS TOOL** when writing, reviewing, or debugging code that uses Redis clients like StackExchange.Redis, ioredis, redis-py, Jedis, Lettuce, or go-redis.
@@ -158,14 +173,17 @@ Data Structures, Memory/TTL, Connections, JSON, Query Engine, Vector Search, Sem
             required: [],
         },
     },
-];
+]);
 
 /**
  * Get best practices for a specific topic.
  */
 export function getBestPractice(kb: KnowledgeBase, topic: string): string {
     // Normalize topic name
-    const topicNormalized = topic.toLowerCase().trim().replace(/ /g, '-').replace(/_/g, '-');
+    const topicNormalized = topic.toLowerCase().trim().replace(TOPIC_SEPARATOR_RE, '-');
+    if (topicNormalized.length < MIN_TOPIC_LENGTH) {
+        return topicNotFound(kb, topic);
+    }
 
     // Try to find exact match first
     const rule = kb.getRuleByTopic(topicNormalized);
@@ -174,17 +192,20 @@ export function getBestPractice(kb: KnowledgeBase, topic: string): string {
     }
 
     // Try fuzzy match
-    const matches = kb.searchRules(topic);
-    if (matches.length > 0) {
-        return kb.ruleToMarkdown(matches[0]);
+    const [bestMatch] = kb.searchRules(topic, 1);
+    if (bestMatch) {
+        return kb.ruleToMarkdown(bestMatch);
     }
 
     // List available topics as fallback
-    const available = kb.listAllTopics();
+    return topicNotFound(kb, topic);
+}
+
+function topicNotFound(kb: KnowledgeBase, topic: string): string {
     return `Topic '${topic}' not found.
 
 Available topics:
-${available.map(t => `  - ${t}`).join('\n')}
+${kb.topicsToMarkdown()}
 
 Tip: Use 'search_best_practices' to search by keyword, or 'list_topics' to browse by category.`;
 }
@@ -198,9 +219,11 @@ export function listTopics(kb: KnowledgeBase, category?: string): string {
     const lines: string[] = ['# Redis Best Practices Topics\n'];
 
     for (const section of sections) {
-        const impactBadge = section.impact === 'HIGH' ? '🔴' : section.impact === 'MEDIUM' ? '🟡' : '🟢';
-        lines.push(`\n## ${section.number}. ${section.name} (${impactBadge} ${section.impact})`);
-        lines.push(`*${section.description}*\n`);
+        const impactBadge = IMPACT_BADGES.get(section.impact) ?? DEFAULT_IMPACT_BADGE;
+        lines.push(
+            `\n## ${section.number}. ${section.name} (${impactBadge} ${section.impact})`,
+            `*${section.description}*\n`,
+        );
 
         for (const rule of section.rules) {
             lines.push(`  - \`${rule.prefix}\` - ${rule.title}`);
@@ -229,18 +252,22 @@ Try:
 - Use 'list_topics' to browse available topics`;
     }
 
-    const lines: string[] = [`# Search Results for '${query}'\n`];
-    lines.push(`Found ${matches.length} matching practice(s):\n`);
+    const lines: string[] = [
+        `# Search Results for '${query}'\n`,
+        `Found ${matches.length} matching practice(s):\n`,
+    ];
 
     // Top 5 results
     for (let i = 0; i < Math.min(matches.length, 5); i++) {
         const rule = matches[i];
-        lines.push(`## ${i + 1}. ${rule.title}`);
-        lines.push(`**Impact:** ${rule.impact} - ${rule.impactDescription}`);
-        lines.push(`**Tags:** ${rule.tags.join(', ')}\n`);
-        lines.push(rule.summary);
-        lines.push(`\n*Use \`get_best_practice('${rule.prefix}')\` for full details.*\n`);
-        lines.push('---\n');
+        lines.push(
+            `## ${i + 1}. ${rule.title}`,
+            `**Impact:** ${rule.impact} - ${rule.impactDescription}`,
+            `**Tags:** ${rule.tags.join(', ')}\n`,
+            rule.summary,
+            `\n*Use \`get_best_practice('${rule.prefix}')\` for full details.*\n`,
+            '---\n',
+        );
     }
 
     return lines.join('\n');
@@ -261,15 +288,17 @@ export function getAntiPatterns(kb: KnowledgeBase, topic?: string): string {
     for (const [category, patterns] of Object.entries(antiPatterns)) {
         lines.push(`\n## ${category}\n`);
         for (const pattern of patterns) {
-            lines.push(`### ❌ ${pattern.title}`);
-            lines.push(`**Why it's bad:** ${pattern.reason}`);
-            lines.push(`\n\`\`\`${pattern.language}`);
-            lines.push(pattern.badCode);
-            lines.push('```\n');
-            lines.push('**Instead, do this:**\n');
-            lines.push(`\`\`\`${pattern.language}`);
-            lines.push(pattern.goodCode);
-            lines.push('```\n');
+            lines.push(
+                `### ❌ ${pattern.title}`,
+                `**Why it's bad:** ${pattern.reason}`,
+                `\n\`\`\`${pattern.language}`,
+                pattern.badCode,
+                '```\n',
+                '**Instead, do this:**\n',
+                `\`\`\`${pattern.language}`,
+                pattern.goodCode,
+                '```\n',
+            );
         }
     }
 
@@ -292,13 +321,15 @@ ${available.map(p => `  - ${p}`).join('\n')}
 Available languages: python, javascript, java`;
     }
 
-    const lines: string[] = [`# ${example.title}\n`];
-    lines.push(`**Pattern:** ${pattern}`);
-    lines.push(`**Language:** ${language}\n`);
-    lines.push(example.description);
-    lines.push(`\n\`\`\`${language}`);
-    lines.push(example.code);
-    lines.push('```\n');
+    const lines: string[] = [
+        `# ${example.title}\n`,
+        `**Pattern:** ${pattern}`,
+        `**Language:** ${language}\n`,
+        example.description,
+        `\n\`\`\`${language}`,
+        example.code,
+        '```\n',
+    ];
 
     if (example.notes.length > 0) {
         lines.push('## Notes\n');
@@ -323,3 +354,29 @@ Available languages: python, javascript, java`;
 export function getFullGuide(kb: KnowledgeBase): string {
     return kb.getFullGuide();
 }
+
+/**
+ * Arguments of a tool call as received from the client.
+ */
+export type ToolArguments = Record<string, unknown> | undefined;
+
+/**
+ * Implementation of a tool, returning its text output.
+ */
+export type ToolHandler = (kb: KnowledgeBase, args: ToolArguments) => string;
+
+/**
+ * Tool implementations keyed by tool name.
+ */
+export const TOOL_HANDLERS: ReadonlyMap<string, ToolHandler> = new Map<string, ToolHandler>([
+    ['get_best_practice', (kb, args) => getBestPractice(kb, (args?.topic as string) || '')],
+    ['list_topics', (kb, args) => listTopics(kb, args?.category as string | undefined)],
+    ['search_best_practices', (kb, args) => searchBestPractices(kb, (args?.query as string) || '')],
+    ['get_anti_patterns', (kb, args) => getAntiPatterns(kb, args?.topic as string | undefined)],
+    ['get_code_example', (kb, args) => getCodeExample(
+        kb,
+        (args?.pattern as string) || '',
+        (args?.language as string) || 'python',
+    )],
+    ['get_full_guide', (kb) => getFullGuide(kb)],
+]);